@@ -1,38 +1,40 @@
 """The Nature Remo integration."""
-import json
+import aiohttp
+import asyncio
 import logging
-import os
 import voluptuous as vol
-import aiofiles
 
 from datetime import timedelta
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
     _DEFAULT_COOL_TEMP,
     _DEFAULT_HEAT_TEMP,
-    _DEFAULT_UPDATE_INTERVAL,
     _CONF_COOL_TEMP,
     _CONF_HEAT_TEMP,
     _CONF_UPDATE_INTERVAL,
     _RESOURCE,
 )
 
-_LOGGER = logging.getLogger(__name__)
+class _PrefixLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that prefixes messages with the integration name."""
 
-def log_debug(msg, *args, **kwargs):
-    """Log debug message with Nature_Remo prefix."""
-    _LOGGER.debug(f"Nature_Remo: {msg}", *args, **kwargs)
+    def process(self, msg, kwargs):
+        """Prefix the message, only called for records that are emitted."""
+        return f"{self.extra['prefix']}: {msg}", kwargs
 
-def log_error(msg, *args, **kwargs):
-    """Log error message with Nature_Remo prefix."""
-    _LOGGER.error(f"Nature_Remo: {msg}", *args, **kwargs)
+_LOGGER = _PrefixLoggerAdapter(logging.getLogger(__name__), {"prefix": "Nature_Remo"})
+
+_PLATFORMS = ("sensor", "climate")
 
 # Keep the YAML config schema for import
 CONFIG_SCHEMA = vol.Schema(
@@ -51,45 +53,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     
     access_token = entry.data["access_token"]
-    update_interval = timedelta(seconds=entry.data.get(_CONF_UPDATE_INTERVAL, _DEFAULT_UPDATE_INTERVAL.seconds))
-    log_debug("Setting up Nature Remo with update interval of %d seconds", update_interval.seconds)
+    update_interval = timedelta(seconds=entry.data[_CONF_UPDATE_INTERVAL])
+    _LOGGER.debug("Setting up Nature Remo with update interval of %d seconds", update_interval.seconds)
     
     session = async_get_clientsession(hass)
     api = NatureRemoAPI(access_token, session)
     
     async def async_update_data():
         """Fetch data from API endpoint."""
-        log_debug("Starting scheduled update of Nature Remo data (interval: %d seconds)", update_interval.seconds)
+        _LOGGER.debug("Starting scheduled update of Nature Remo data (interval: %d seconds)", update_interval.seconds)
         try:
             data = await api.get()
-            log_debug("Successfully fetched new data from Nature Remo API")
-            return data
-        except Exception as err:
-            log_error("Error fetching Nature Remo data: %s", err, exc_info=True)
+            _LOGGER.debug("Successfully fetched new data from Nature Remo API")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(
+                "Error fetching Nature Remo data: %s",
+                err,
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+            )
             raise
+
+        # Index smart meter readings by EPC so sensors can look them up directly
+        smart_meters = []
+        for appliance in data["appliances"].values():
+            if appliance["type"] == "EL_SMART_METER":
+                smart_meters.append(appliance)
+            smart_meter = appliance.get("smart_meter")
+            if smart_meter is not None:
+                smart_meter["_epc_index"] = {
+                    prop["epc"]: prop["val"]
+                    for prop in smart_meter["echonetlite_properties"]
+                }
+        data["smart_meters"] = smart_meters
+
+        # Group devices by the sensor events they report
+        sensor_devices_by_event = {}
+        for device in data["devices"].values():
+            for event_key in device["newest_events"]:
+                sensor_devices_by_event.setdefault(event_key, []).append(device)
+        data["sensor_devices_by_event"] = sensor_devices_by_event
+        return data
     
     coordinator = DataUpdateCoordinator(
         hass,
-        _LOGGER,
+        _LOGGER.logger,
         name="Nature Remo update",
         update_method=async_update_data,
         update_interval=update_interval,
+        always_update=False,
     )
     
-    # Add coordinator update listener
-    @callback
-    def coordinator_update():
-        """Log coordinator updates."""
-        log_debug("Coordinator update received, last_update_success: %s", coordinator.last_update_success)
-    
-    coordinator.async_add_listener(coordinator_update)
-    
-    log_debug("Starting initial data fetch for Nature Remo")
+    _LOGGER.debug("Starting initial data fetch for Nature Remo")
     try:
         await coordinator.async_refresh()
-        log_debug("Initial data fetch complete")
+        _LOGGER.debug("Initial data fetch complete")
     except Exception as err:
-        log_error("Error during initial data fetch: %s", err, exc_info=True)
+        _LOGGER.error("Error during initial data fetch: %s", err, exc_info=True)
         raise
     
     # Store coordinator in hass data
@@ -102,14 +121,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }
     }
     
-    log_debug("Setting up platforms with coordinator (update_interval: %s)", coordinator.update_interval)
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "climate"])
-    log_debug("Platform setup complete")
+    _LOGGER.debug("Setting up platforms with coordinator (update_interval: %s)", coordinator.update_interval)
+    await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    _LOGGER.debug("Platform setup complete")
     return True
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old entry."""
+    # Imported here as the config flow imports from this module
+    from .config_flow import NatureRemoConfigFlow
+
+    return await NatureRemoConfigFlow.async_migrate_entry(hass, entry)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "climate"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
@@ -118,22 +144,24 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Nature Remo component."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Simple file-based approach to track notification state
-    storage_file = hass.config.path(f".{DOMAIN}_notification_state.json")
-    log_debug("Using storage file at: %s", storage_file)
+    # Track notification state in Home Assistant's storage
+    store = Store(hass, version=1, key=f"{DOMAIN}_notification_state")
     
     notification_shown = False
     
     try:
-        if os.path.exists(storage_file):
-            async with aiofiles.open(storage_file, 'r') as f:
-                data = json.loads(await f.read())
-                notification_shown = data.get('acknowledged', False)
+        data = await store.async_load()
+        if data is not None:
+            notification_shown = data.get('acknowledged', False)
     except Exception as ex:
-        log_debug("Error loading notification state: %s", ex)
+        _LOGGER.debug("Error loading notification state: %s", ex)
+
+    # Keep the state in memory so the file is only touched again when the
+    # notification goes from unacknowledged to acknowledged
+    hass.data[DOMAIN]["_notification_ack"] = notification_shown
 
     if DOMAIN in config:
-        log_debug("Found YAML configuration for Nature Remo")
+        _LOGGER.debug("Found YAML configuration for Nature Remo")
 
         # If notification hasn't been shown yet
         if not notification_shown:
@@ -154,53 +182,68 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 },
             )
             
-            # Log all events to see what's happening
-            async def log_all_events(event):
-                """Log all events to see what's happening."""
-                # Any event that looks related to notifications
-                if "notification" in event.event_type.lower():
-                    # See if our notification_id appears anywhere in the event data
-                    event_data_str = str(event.data)
-                    if notification_id in event_data_str:
-                        try:
-                            # Save the acknowledged state regardless of the exact event type
-                            async with aiofiles.open(storage_file, 'w') as f:
-                                await f.write(json.dumps({"acknowledged": True}))
-                        except Exception as ex:
-                            log_debug("Failed to save acknowledged state: %s", ex)
-            
-            # Listen for ALL events for diagnostic purposes
-            remove_listener = hass.bus.async_listen("*", log_all_events)
+            @callback
+            def stop_tracking():
+                """Remove the notification listener and the fallback task."""
+                remove_listener = hass.data[DOMAIN].pop("remove_listener", None)
+                if remove_listener is not None:
+                    remove_listener()
+                cancel_auto_acknowledge = hass.data[DOMAIN].pop(
+                    "cancel_auto_acknowledge", None
+                )
+                if cancel_auto_acknowledge is not None:
+                    cancel_auto_acknowledge()
+
+            async def save_acknowledged():
+                """Persist the acknowledged state if it isn't saved yet."""
+                if hass.data[DOMAIN]["_notification_ack"]:
+                    return True
+                try:
+                    await store.async_save({"acknowledged": True})
+                except Exception as ex:
+                    _LOGGER.debug("Failed to save acknowledged state: %s", ex)
+                    return False
+                hass.data[DOMAIN]["_notification_ack"] = True
+                return True
+
+            # Persistent notifications are announced through a dispatcher
+            # signal rather than the event bus, so only changes to
+            # notifications reach this handler.
+            async def notification_updated(update_type, notifications):
+                """Save the acknowledged state once our notification is dismissed."""
+                if update_type != persistent_notification.UpdateType.REMOVED:
+                    return
+                if notification_id not in notifications:
+                    return
+                if await save_acknowledged():
+                    stop_tracking()
+
+            remove_listener = persistent_notification.async_register_callback(
+                hass, notification_updated
+            )
             
             # Store the listener so it doesn't get garbage collected
             hass.data[DOMAIN]["remove_listener"] = remove_listener
             
-            # Also create a one-time task to auto-acknowledge after 5 minutes
-            # as a fallback in case the event system isn't working
-            async def auto_acknowledge():
+            # Also schedule an auto-acknowledge after 5 minutes as a
+            # fallback in case the notification listener isn't working
+            async def auto_acknowledge(_now):
                 """Automatically acknowledge after a timeout."""
-                import asyncio
-                await asyncio.sleep(300)  # 5 minutes
-                
-                # Check if we've already acknowledged
-                try:
-                    if os.path.exists(storage_file):
-                        async with aiofiles.open(storage_file, 'r') as f:
-                            data = json.loads(await f.read())
-                            if data.get('acknowledged', False):
-                                return  # Already acknowledged, nothing to do
-                    
-                    # Not acknowledged yet, do it now
-                    log_debug("Auto-acknowledging notification after timeout")
-                    async with aiofiles.open(storage_file, 'w') as f:
-                        await f.write(json.dumps({"acknowledged": True}))
-                except Exception as ex:
-                    log_debug("Error in auto-acknowledge: %s", ex)
+                # The timer has fired, there is nothing left to cancel
+                hass.data[DOMAIN].pop("cancel_auto_acknowledge", None)
+
+                if not hass.data[DOMAIN]["_notification_ack"]:
+                    _LOGGER.debug("Auto-acknowledging notification after timeout")
+                if await save_acknowledged():
+                    stop_tracking()
             
-            # Start the auto-acknowledge task
-            hass.async_create_task(auto_acknowledge())
+            # Keep the cancel handle so the timer can be dropped once the
+            # notification is dismissed
+            hass.data[DOMAIN]["cancel_auto_acknowledge"] = async_call_later(
+                hass, 300, auto_acknowledge
+            )
         else:
-            log_debug("Notification was previously acknowledged, skipping")
+            _LOGGER.debug("Notification was previously acknowledged, skipping")
 
         # Forward the YAML config to the config flow
         hass.async_create_task(
@@ -218,125 +261,132 @@ class NatureRemoAPI:
 
     def __init__(self, access_token, session):
         """Init API client"""
-        self._access_token = access_token
         self._session = session
-        log_debug("Initialized Nature Remo API client")
+        self._headers = {"Authorization": f"Bearer {access_token}"}
+        # ETags and parsed results of the last successful GET per path
+        self._etags = {}
+        self._cache = {}
+        _LOGGER.debug("Initialized Nature Remo API client")
 
     async def get(self):
         """Get appliance and device list"""
-        log_debug("Fetching data from Nature Remo API")
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        _LOGGER.debug("Fetching data from Nature Remo API")
         
-        # Get appliances
-        log_debug("Fetching appliances from %s/appliances", _RESOURCE)
+        # Request appliances and devices concurrently
         try:
-            response = await self._session.get(f"{_RESOURCE}/appliances", headers=headers)
-            response.raise_for_status()  # Raise exception for bad status codes
-            appliances_data = await response.json()
-            log_debug("Received appliances data: %s", appliances_data)
-            appliances = {x["id"]: x for x in appliances_data}
-        except Exception as err:
-            log_error("Error fetching appliances: %s", err, exc_info=True)
-            raise
-        
-        # Get devices
-        log_debug("Fetching devices from %s/devices", _RESOURCE)
-        try:
-            response = await self._session.get(f"{_RESOURCE}/devices", headers=headers)
-            response.raise_for_status()  # Raise exception for bad status codes
-            devices_data = await response.json()
-            log_debug("Received devices data: %s", devices_data)
-            devices = {x["id"]: x for x in devices_data}
-        except Exception as err:
-            log_error("Error fetching devices: %s", err, exc_info=True)
+            appliances, devices = await asyncio.gather(
+                self.get_appliances(), self.get_devices()
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(
+                "Error fetching appliances and devices: %s",
+                err,
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+            )
             raise
         
-        log_debug("API call completed successfully")
+        _LOGGER.debug("API call completed successfully")
         return {"appliances": appliances, "devices": devices}
 
+    async def validate(self):
+        """Check the access token against the user endpoint"""
+        _LOGGER.debug("Validating access token with %s/users/me", _RESOURCE)
+        async with self._session.get(
+            f"{_RESOURCE}/users/me", headers=self._headers
+        ) as response:
+            response.raise_for_status()  # Raise exception for bad status codes
+
+    async def get_appliances(self):
+        """Get appliances, including smart meter readings and AC settings"""
+        return await self._get_list("/appliances")
+
+    async def get_devices(self):
+        """Get devices and their newest sensor events"""
+        return await self._get_list("/devices")
+
+    async def _get_list(self, path):
+        """Get a list resource keyed by id, reusing it if unchanged"""
+        _LOGGER.debug("Fetching %s%s", _RESOURCE, path)
+        headers = self._headers
+        etag = self._etags.get(path)
+        if etag is not None:
+            headers = {**self._headers, "If-None-Match": etag}
+
+        response = await self._session.get(f"{_RESOURCE}{path}", headers=headers)
+        if response.status == 304:
+            _LOGGER.debug("%s not modified, reusing previous data", path)
+            return self._cache[path]
+        response.raise_for_status()  # Raise exception for bad status codes
+        data = json_loads(await response.read())
+        _LOGGER.debug("Received %d items from %s", len(data), path)
+
+        result = {x["id"]: x for x in data}
+        self._cache[path] = result
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            self._etags[path] = etag
+        else:
+            self._etags.pop(path, None)
+        return result
+
     async def post(self, path, data):
         """Post any request"""
-        log_debug("Making POST request to %s%s with data: %s", _RESOURCE, path, data)
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        _LOGGER.debug("Making POST request to %s%s with data: %s", _RESOURCE, path, data)
         try:
             response = await self._session.post(
-                f"{_RESOURCE}{path}", data=data, headers=headers
+                f"{_RESOURCE}{path}", data=data, headers=self._headers
             )
             response.raise_for_status()  # Raise exception for bad status codes
-            response_data = await response.json()
-            log_debug("Received POST response: %s", response_data)
+            response_data = json_loads(await response.read())
+            _LOGGER.debug("Received POST response from %s%s", _RESOURCE, path)
             return response_data
-        except Exception as err:
-            log_error("Error in POST request: %s", err, exc_info=True)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(
+                "Error in POST request: %s",
+                err,
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+            )
             raise
 
-class NatureRemoBase(Entity):
-    """Nature Remo entity base class."""
-
-    def __init__(self, coordinator, appliance):
-        self._coordinator = coordinator
-        self._name = f"Nature Remo {appliance['nickname']}"
-        self._appliance_id = appliance["id"]
-        self._device = appliance["device"]
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._appliance_id
+class _NatureRemoEntityBase(CoordinatorEntity):
+    """Shared base class for Nature Remo entities."""
 
-    @property
-    def should_poll(self):
-        """Return the polling requirement of the entity."""
-        return False
+    def __init__(self, coordinator, device, name, unique_id):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id = device["id"]
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+        self._device_info = {
+            "identifiers": {(DOMAIN, device["id"])},
+            "name": device["name"],
+            "manufacturer": "Nature Remo",
+            "model": device["serial_number"],
+            "sw_version": device["firmware_version"],
+        }
 
     @property
     def device_info(self):
         """Return the device info for the sensor."""
-        return {
-            "identifiers": {(DOMAIN, self._device["id"])},
-            "name": self._device["name"],
-            "manufacturer": "Nature Remo",
-            "model": self._device["serial_number"],
-            "sw_version": self._device["firmware_version"],
-        }
+        return self._device_info
+
+class NatureRemoBase(_NatureRemoEntityBase):
+    """Nature Remo entity base class."""
 
-class NatureRemoDeviceBase(Entity):
+    def __init__(self, coordinator, appliance):
+        super().__init__(
+            coordinator,
+            appliance["device"],
+            f"Nature Remo {appliance['nickname']}",
+            appliance["id"],
+        )
+        self._appliance_id = appliance["id"]
+
+class NatureRemoDeviceBase(_NatureRemoEntityBase):
     """Nature Remo device entity base class."""
 
     def __init__(self, coordinator, device):
         """Initialize the device entity."""
-        self._coordinator = coordinator
-        self._device = device
-        self._name = f"Nature Remo {device['name']}"
-        self._device_id = device["id"]
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._device_id
-
-    @property
-    def should_poll(self):
-        """Return the polling requirement of the entity."""
-        return False
-
-    @property
-    def device_info(self):
-        """Return the device info for the sensor."""
-        return {
-            "identifiers": {(DOMAIN, self._device["id"])},
-            "name": self._device["name"],
-            "manufacturer": "Nature Remo",
-            "model": self._device["serial_number"],
-            "sw_version": self._device["firmware_version"],
-        }
+        super().__init__(
+            coordinator, device, f"Nature Remo {device['name']}", device["id"]
+        )
@@ -80,6 +80,7 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
             HVACMode.HEAT: config[_CONF_HEAT_TEMP],
         }
         self._modes = appliance["aircon"]["range"]["modes"]
+        self._attr_hvac_modes = [MODE_REMO_TO_HA[mode] for mode in self._modes] + [HVACMode.OFF]
         self._hvac_mode = None
         self._current_temperature = None
         self._target_temperature = None
@@ -87,7 +88,7 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         self._fan_mode = None
         self._swing_mode = None
         self._last_target_temperature = {v: None for v in MODE_REMO_TO_HA}
-        self._update(appliance["settings"])
+        self._update(appliance["settings"], coordinator.data["devices"][self._device_id])
 
     @property
     def supported_features(self):
@@ -142,14 +143,6 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         """Return hvac operation ie. heat, cool mode."""
         return self._hvac_mode
 
-    @property
-    def hvac_modes(self):
-        """Return the list of available operation modes."""
-        remo_modes = list(self._modes.keys())
-        ha_modes = list(map(lambda mode: MODE_REMO_TO_HA[mode], remo_modes))
-        ha_modes.append(HVACMode.OFF)
-        return ha_modes
-
     @property
     def fan_mode(self):
         """Return the fan setting."""
@@ -225,19 +218,6 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         _LOGGER.debug("Set swing mode: %s", swing_mode)
         await self._post({"air_direction": swing_mode})
 
-    async def async_added_to_hass(self):
-        """Subscribe to updates."""
-        self.async_on_remove(
-            self._coordinator.async_add_listener(self._update_callback)
-        )
-
-    async def async_update(self):
-        """Update the entity.
-
-        Only used by the generic entity update service.
-        """
-        await self._coordinator.async_request_refresh()
-
     def _update(self, ac_settings, device=None):
         # hold this to determin the ac mode while it's turned-off
         self._remo_mode = ac_settings["mode"]
@@ -259,10 +239,11 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
             self._current_temperature = float(device["newest_events"]["te"]["val"])
 
     @callback
-    def _update_callback(self):
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
         self._update(
-            self._coordinator.data["appliances"][self._appliance_id]["settings"],
-            self._coordinator.data["devices"][self._device["id"]],
+            self.coordinator.data["appliances"][self._appliance_id]["settings"],
+            self.coordinator.data["devices"][self._device_id],
         )
         self.async_write_ha_state()
 
@@ -270,6 +251,9 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         response = await self._api.post(
             f"/appliances/{self._appliance_id}/aircon_settings", data
         )
+        # Keep the coordinator data in line with the state shown, so the
+        # next poll is compared against it and any outside change notifies
+        self.coordinator.data["appliances"][self._appliance_id]["settings"] = response
         self._update(response)
         self.async_write_ha_state()
 
@@ -12,19 +12,19 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.config_entries import ConfigEntryState
 
-from . import NatureRemoAPI
+from . import NatureRemoAPI, _PrefixLoggerAdapter
 from .const import (
     DOMAIN,
     _CONF_UPDATE_INTERVAL,
     _DEFAULT_UPDATE_INTERVAL,
     UPDATE_INTERVAL_OPTIONS,
+    UPDATE_INTERVAL_MIN,
+    UPDATE_INTERVAL_MAX,
 )
 
-_LOGGER = logging.getLogger(__name__)
-
-def log_debug(msg, *args, **kwargs):
-    """Log debug message with Nature_Remo prefix."""
-    _LOGGER.debug(f"Nature_Remo Config Flow: {msg}", *args, **kwargs)
+_LOGGER = _PrefixLoggerAdapter(
+    logging.getLogger(__name__), {"prefix": "Nature_Remo Config Flow"}
+)
 
 class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Nature Remo."""
@@ -34,72 +34,63 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     @staticmethod
     async def async_migrate_entry(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> bool:
         """Migrate old entry."""
-        log_debug("Starting migration for entry %s (version %s, state %s)", 
+        _LOGGER.debug("Starting migration for entry %s (version %s, state %s)", 
                  entry.entry_id, entry.version, entry.state)
-        log_debug("Current entry data: %s", entry.data)
+        _LOGGER.debug("Current entry data: %s", entry.data)
 
         try:
             if entry.version == 1:
-                log_debug("Migrating from version 1 to 2")
+                _LOGGER.debug("Migrating from version 1 to 2")
                 # Version 1 to 2: Add update interval
                 new_data = {**entry.data, _CONF_UPDATE_INTERVAL: _DEFAULT_UPDATE_INTERVAL.seconds}
-                log_debug("New data will be: %s", new_data)
+                _LOGGER.debug("New data will be: %s", new_data)
                 
                 # Update the entry
                 hass.config_entries.async_update_entry(
                     entry,
                     data=new_data,
                     version=2,
-                    state=ConfigEntryState.NOT_LOADED  # Reset state to allow reload
                 )
-                log_debug("Migration to version 2 successful")
+                _LOGGER.debug("Migration to version 2 successful")
                 return True
 
-            log_debug("No migration needed for version %s", entry.version)
+            _LOGGER.debug("No migration needed for version %s", entry.version)
             return False
         except Exception as err:
-            log_debug("Error during migration: %s", err, exc_info=True)
-            # If migration fails, we need to mark the entry as failed
-            try:
-                hass.config_entries.async_update_entry(
-                    entry,
-                    state=ConfigEntryState.SETUP_ERROR,
-                )
-                log_debug("Marked entry as SETUP_ERROR")
-            except Exception as update_err:
-                log_debug("Failed to update entry state: %s", update_err, exc_info=True)
+            _LOGGER.debug("Error during migration: %s", err, exc_info=True)
+            # Home Assistant marks the entry as MIGRATION_ERROR when this fails
             return False
 
     async def async_step_user(self, user_input=None) -> FlowResult:
         """Handle the initial step."""
-        log_debug("Starting user step with input: %s", user_input)
+        _LOGGER.debug("Starting user step with input: %s", user_input)
         errors = {}
 
         # Check if already configured
         current_entries = self._async_current_entries()
-        log_debug("Current entries: %s", [(e.entry_id, e.version, e.state) for e in current_entries])
+        _LOGGER.debug("Current entries: %s", [(e.entry_id, e.version, e.state) for e in current_entries])
 
         if current_entries:
             # If we have an entry in MIGRATION_ERROR state, we need to handle it
             for entry in current_entries:
-                log_debug("Checking entry %s (state: %s)", entry.entry_id, entry.state)
+                _LOGGER.debug("Checking entry %s (state: %s)", entry.entry_id, entry.state)
                 if entry.state in (ConfigEntryState.MIGRATION_ERROR, ConfigEntryState.SETUP_ERROR):
-                    log_debug("Found entry in error state, removing: %s", entry.entry_id)
+                    _LOGGER.debug("Found entry in error state, removing: %s", entry.entry_id)
                     try:
                         await self.hass.config_entries.async_remove(entry.entry_id)
-                        log_debug("Successfully removed entry %s", entry.entry_id)
+                        _LOGGER.debug("Successfully removed entry %s", entry.entry_id)
                     except Exception as err:
-                        log_debug("Error removing entry: %s", err, exc_info=True)
+                        _LOGGER.debug("Error removing entry: %s", err, exc_info=True)
                     break
             else:
-                log_debug("No entries in error state, aborting as already configured")
+                _LOGGER.debug("No entries in error state, aborting as already configured")
                 return self.async_abort(reason="already_configured")
 
         if user_input is not None:
-            log_debug("Processing user input")
+            _LOGGER.debug("Processing user input")
             try:
                 await self._validate_token(user_input[CONF_ACCESS_TOKEN])
-                log_debug("Token validation successful")
+                _LOGGER.debug("Token validation successful")
                 return self.async_create_entry(
                     title="Nature Remo",
                     data={
@@ -108,13 +99,13 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     },
                 )
             except InvalidAuth:
-                log_debug("Invalid authentication")
+                _LOGGER.debug("Invalid authentication")
                 errors["base"] = "invalid_auth"
             except Exception as err:  # pylint: disable=broad-except
-                log_debug("Unexpected exception: %s", err, exc_info=True)
+                _LOGGER.debug("Unexpected exception: %s", err, exc_info=True)
                 errors["base"] = "unknown"
 
-        log_debug("Showing form with errors: %s", errors)
+        _LOGGER.debug("Showing form with errors: %s", errors)
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
@@ -124,8 +115,8 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={
                 "url": "https://home.nature.global",
-                "min_interval": str(min(UPDATE_INTERVAL_OPTIONS)),
-                "max_interval": str(max(UPDATE_INTERVAL_OPTIONS)),
+                "min_interval": str(UPDATE_INTERVAL_MIN),
+                "max_interval": str(UPDATE_INTERVAL_MAX),
             }
         )
 
@@ -152,35 +143,35 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except InvalidAuth:
             return self.async_abort(reason="invalid_auth")
         except Exception:  # pylint: disable=broad-except
-            log_debug("Unexpected exception", exc_info=True)
+            _LOGGER.debug("Unexpected exception", exc_info=True)
             return self.async_abort(reason="unknown")
 
     async def async_step_reconfigure(self, user_input=None) -> FlowResult:
         """Handle reconfiguration."""
-        log_debug("Starting reconfigure step with input: %s", user_input)
+        _LOGGER.debug("Starting reconfigure step with input: %s", user_input)
         entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
         if not entry:
-            log_debug("Entry not found for reconfigure")
+            _LOGGER.debug("Entry not found for reconfigure")
             return self.async_abort(reason="not_found")
 
-        log_debug("Found entry %s (state: %s)", entry.entry_id, entry.state)
+        _LOGGER.debug("Found entry %s (state: %s)", entry.entry_id, entry.state)
 
         # If the entry is in error state, we need to remove it first
         if entry.state in (ConfigEntryState.MIGRATION_ERROR, ConfigEntryState.SETUP_ERROR):
-            log_debug("Entry in error state, removing and starting fresh")
+            _LOGGER.debug("Entry in error state, removing and starting fresh")
             try:
                 await self.hass.config_entries.async_remove(entry.entry_id)
-                log_debug("Successfully removed entry %s", entry.entry_id)
+                _LOGGER.debug("Successfully removed entry %s", entry.entry_id)
             except Exception as err:
-                log_debug("Error removing entry: %s", err, exc_info=True)
+                _LOGGER.debug("Error removing entry: %s", err, exc_info=True)
             return await self.async_step_user(user_input)
 
         errors = {}
         if user_input is not None:
-            log_debug("Processing reconfigure input")
+            _LOGGER.debug("Processing reconfigure input")
             try:
                 await self._validate_token(user_input[CONF_ACCESS_TOKEN])
-                log_debug("Token validation successful")
+                _LOGGER.debug("Token validation successful")
                 self.hass.config_entries.async_update_entry(
                     entry,
                     data={
@@ -188,17 +179,17 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         _CONF_UPDATE_INTERVAL: user_input[_CONF_UPDATE_INTERVAL],
                     },
                 )
-                log_debug("Entry updated, reloading")
+                _LOGGER.debug("Entry updated, reloading")
                 await self.hass.config_entries.async_reload(entry.entry_id)
                 return self.async_abort(reason="reconfigure_successful")
             except InvalidAuth:
-                log_debug("Invalid authentication")
+                _LOGGER.debug("Invalid authentication")
                 errors["base"] = "invalid_auth"
             except Exception as err:  # pylint: disable=broad-except
-                log_debug("Unexpected exception: %s", err, exc_info=True)
+                _LOGGER.debug("Unexpected exception: %s", err, exc_info=True)
                 errors["base"] = "unknown"
 
-        log_debug("Showing reconfigure form with errors: %s", errors)
+        _LOGGER.debug("Showing reconfigure form with errors: %s", errors)
         return self.async_show_form(
             step_id="reconfigure",
             data_schema=vol.Schema({
@@ -208,21 +199,21 @@ class NatureRemoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={
                 "url": "https://home.nature.global",
-                "min_interval": str(min(UPDATE_INTERVAL_OPTIONS)),
-                "max_interval": str(max(UPDATE_INTERVAL_OPTIONS)),
+                "min_interval": str(UPDATE_INTERVAL_MIN),
+                "max_interval": str(UPDATE_INTERVAL_MAX),
             }
         )
 
     async def _validate_token(self, access_token: str) -> None:
         """Validate the access token."""
-        log_debug("Validating access token")
+        _LOGGER.debug("Validating access token")
         session = async_get_clientsession(self.hass)
         api = NatureRemoAPI(access_token, session)
         try:
-            await api.get()
-            log_debug("Token validation successful")
+            await api.validate()
+            _LOGGER.debug("Token validation successful")
         except Exception as err:
-            log_debug("Error validating access token: %s", err, exc_info=True)
+            _LOGGER.debug("Error validating access token: %s", err, exc_info=True)
             raise InvalidAuth from err
 
 class InvalidAuth(HomeAssistantError):
@@ -12,6 +12,8 @@ _DEFAULT_HEAT_TEMP = 20
 # Update interval configuration
 _CONF_UPDATE_INTERVAL = "update_interval"
 _DEFAULT_UPDATE_INTERVAL = timedelta(seconds=60)
-UPDATE_INTERVAL_OPTIONS = [10, 15, 30, 45, 60, 90, 120]  # Available options in seconds
+UPDATE_INTERVAL_OPTIONS = (10, 15, 30, 45, 60, 90, 120)  # Available options in seconds
+UPDATE_INTERVAL_MIN = min(UPDATE_INTERVAL_OPTIONS)
+UPDATE_INTERVAL_MAX = max(UPDATE_INTERVAL_OPTIONS)
 
-_RESOURCE = "https://api.nature.global/1/" 
\ No newline at end of file
+_RESOURCE = "https://api.nature.global/1"
\ No newline at end of file
@@ -1,24 +1,32 @@
 """Support for Nature Remo E energy sensor."""
 import logging
 
+from typing import Final
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     UnitOfPower,
     PERCENTAGE,
     LIGHT_LUX,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util.unit_system import UnitOfTemperature
-from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+
+from . import DOMAIN, NatureRemoBase, NatureRemoDeviceBase, _PrefixLoggerAdapter
 
-from . import DOMAIN, NatureRemoBase, NatureRemoDeviceBase
+_LOGGER = _PrefixLoggerAdapter(logging.getLogger(__name__), {"prefix": "Nature_Remo"})
 
-_LOGGER = logging.getLogger(__name__)
+# ECHONET Lite property code for measured instantaneous electric power
+_EPC_MEASURED_INSTANTANEOUS_POWER: Final = 231
 
-def log_debug(msg, *args, **kwargs):
-    """Log debug message with Nature_Remo prefix."""
-    _LOGGER.debug(f"Nature_Remo: {msg}", *args, **kwargs)
+# Name suffix, unit and device class for each event key in a device's newest_events
+_DEVICE_SENSORS: Final = {
+    "te": ("Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    "hu": ("Humidity", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    "il": ("Illuminance", LIGHT_LUX, SensorDeviceClass.ILLUMINANCE),
+}
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,178 +35,86 @@ async def async_setup_entry(
 ) -> None:
     """Set up Nature Remo sensors based on config_entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    appliances = coordinator.data["appliances"]
-    devices = coordinator.data["devices"]
-    
-    log_debug("Setting up sensors with appliances: %s", appliances)
-    log_debug("Setting up sensors with devices: %s", devices)
+    sensor_devices_by_event = coordinator.data["sensor_devices_by_event"]
     
     entities = [
         NatureRemoE(coordinator, appliance)
-        for appliance in appliances.values()
-        if appliance["type"] == "EL_SMART_METER"
+        for appliance in coordinator.data["smart_meters"]
     ]
     
-    for device in devices.values():
-        log_debug("Processing device %s with events: %s", device["name"], device["newest_events"])
-        for sensor in device["newest_events"].keys():
-            if sensor == "te":
-                entities.append(NatureRemoTemperatureSensor(coordinator, device))
-            elif sensor == "hu":
-                entities.append(NatureRemoHumiditySensor(coordinator, device))
-            elif sensor == "il":
-                entities.append(NatureRemoIlluminanceSensor(coordinator, device))
+    entities.extend(
+        NatureRemoDeviceSensor(
+            coordinator,
+            device,
+            event_key,
+            device["newest_events"][event_key],
+            *description,
+        )
+        for event_key, description in _DEVICE_SENSORS.items()
+        for device in sensor_devices_by_event.get(event_key, ())
+    )
     
-    log_debug("Created %d sensor entities", len(entities))
-    async_add_entities(entities)
+    _LOGGER.debug("Created %d sensor entities", len(entities))
+    # Values are already taken from the coordinator data in __init__
+    async_add_entities(entities, update_before_add=False)
 
 
-class NatureRemoE(NatureRemoBase):
+class NatureRemoE(NatureRemoBase, SensorEntity):
     """Implementation of a Nature Remo E sensor."""
 
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._unit_of_measurement = UnitOfPower.WATT
-        log_debug("Initialized Nature Remo E sensor for appliance: %s", appliance)
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        appliance = self._coordinator.data["appliances"][self._appliance_id]
-        log_debug("Processing Nature Remo E data for appliance %s: %s", self._appliance_id, appliance)
-        
-        smart_meter = appliance["smart_meter"]
-        log_debug("Smart meter data: %s", smart_meter)
-        
-        echonetlite_properties = smart_meter["echonetlite_properties"]
-        log_debug("EchonetLite properties: %s", echonetlite_properties)
-        
-        measured_instantaneous = next(
-            value["val"] for value in echonetlite_properties if value["epc"] == 231
-        )
-        log_debug("Measured instantaneous power: %sW", measured_instantaneous)
-        return measured_instantaneous
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return UnitOfPower.WATT
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.power
-
-    async def async_added_to_hass(self):
-        """Subscribe to updates."""
-        log_debug("Nature Remo E sensor added to hass: %s", self.name)
-        self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_update(self):
-        """Update the entity."""
-        log_debug("Updating Nature Remo E sensor: %s", self.name)
-        await self._coordinator.async_request_refresh()
-
-
-class NatureRemoTemperatureSensor(NatureRemoDeviceBase):
-    """Implementation of a Nature Remo sensor."""
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _attr_device_class = SensorDeviceClass.POWER
 
     def __init__(self, coordinator, appliance):
         super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Temperature"
-        log_debug("Initialized temperature sensor for device: %s", appliance)
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._device["id"] + "-te"
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        log_debug("Processing temperature data for device %s: %s", self._device["id"], device)
-        
-        temperature = device["newest_events"]["te"]["val"]
-        log_debug("Temperature value: %s°C", temperature)
-        return temperature
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.TEMPERATURE
-
-
-class NatureRemoHumiditySensor(NatureRemoDeviceBase):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Humidity"
-        log_debug("Initialized humidity sensor for device: %s", appliance)
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._device["id"] + "-hu"
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return PERCENTAGE
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        log_debug("Processing humidity data for device %s: %s", self._device["id"], device)
-        
-        humidity = device["newest_events"]["hu"]["val"]
-        log_debug("Humidity value: %s%%", humidity)
-        return humidity
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.HUMIDITY
-
-
-class NatureRemoIlluminanceSensor(NatureRemoDeviceBase):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Illuminance"
-        log_debug("Initialized illuminance sensor for device: %s", appliance)
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._device["id"] + "-il"
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return LIGHT_LUX
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        log_debug("Processing illuminance data for device %s: %s", self._device["id"], device)
+        self._update_native_value()
+        _LOGGER.debug("Initialized Nature Remo E sensor for appliance: %s", appliance)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        self.async_write_ha_state()
+
+    def _update_native_value(self):
+        """Read the instantaneous power from the coordinator data."""
+        appliance = self.coordinator.data["appliances"][self._appliance_id]
+        smart_meter = appliance["smart_meter"]
         
-        illuminance = device["newest_events"]["il"]["val"]
-        log_debug("Illuminance value: %slx", illuminance)
-        return illuminance
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.ILLUMINANCE 
+        measured_instantaneous = smart_meter["_epc_index"][_EPC_MEASURED_INSTANTANEOUS_POWER]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Processing Nature Remo E data for appliance %s: %s", self._appliance_id, appliance)
+            _LOGGER.debug("Smart meter data: %s", smart_meter)
+            _LOGGER.debug("Measured instantaneous power: %sW", measured_instantaneous)
+        self._attr_native_value = measured_instantaneous
+
+
+class NatureRemoDeviceSensor(NatureRemoDeviceBase, SensorEntity):
+    """Implementation of a Nature Remo device sensor."""
+
+    __slots__ = ("_event_key",)
+
+    def __init__(self, coordinator, device, event_key, event, suffix, unit, device_class):
+        super().__init__(coordinator, device)
+        self._event_key = event_key
+        self._attr_name = self._attr_name.strip() + " " + suffix
+        self._attr_unique_id = f"{self._device_id}-{event_key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._update_native_value(event)
+        _LOGGER.debug("Initialized %s sensor for device: %s", suffix.lower(), device)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
+        device = self.coordinator.data["devices"][self._device_id]
+        self._update_native_value(device["newest_events"][self._event_key])
+        self.async_write_ha_state()
+
+    def _update_native_value(self, event):
+        """Take the sensor value from the newest event."""
+        value = event["val"]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Processing %s event for device %s: %s", self._event_key, self._device_id, event)
+            _LOGGER.debug("%s value: %s %s", self._event_key, value, self._attr_native_unit_of_measurement)
+        self._attr_native_value = value